@@ -14,15 +14,23 @@
 """Functions to apply operations to a qutrit mixed state."""
 # pylint: disable=unused-argument
 
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from string import ascii_letters as alphabet
 
+import numpy as onp
+
 import pennylane as qml
 from pennylane import math
 from pennylane import numpy as np
 from pennylane.operation import Channel
 
-from .utils import QUDIT_DIM, get_einsum_mapping, get_new_state_einsum_indices
+from .utils import (
+    QUDIT_DIM,
+    get_einsum_mapping,
+    get_new_state_einsum_indices,
+    get_num_wires,
+    reshape_state_as_matrix,
+)
 
 alphabet_array = np.array(list(alphabet))
 
@@ -94,6 +102,54 @@ def apply_operation_einsum(op: qml.operation.Operator, state, is_state_batched:
     return math.einsum(einsum_indices, kraus, state, kraus_dagger)
 
 
+@lru_cache()
+def _get_basis_permutation(op_type, op_wires, num_wires):
+    """Compute the permutation of all computational basis states of a ``num_wires``-qutrit system
+    induced by an operation of type ``op_type`` acting on ``op_wires``.
+
+    Args:
+        op_type (type): Operation class defining ``compute_permutation``
+        op_wires (tuple[int]): Wires the operation acts on
+        num_wires (int): Number of wires of the state
+
+    Returns:
+        ndarray: permutation of the indices of the flattened computational basis
+    """
+    op_axes = list(op_wires)
+    front_axes = list(range(len(op_axes)))
+
+    # Permute the labels of the computational basis states along the wires of the operation
+    labels = onp.arange(QUDIT_DIM**num_wires).reshape([QUDIT_DIM] * num_wires)
+    labels = onp.moveaxis(labels, op_axes, front_axes).reshape(QUDIT_DIM ** len(op_axes), -1)
+    labels = labels[op_type.compute_permutation()].reshape([QUDIT_DIM] * num_wires)
+    return onp.moveaxis(labels, front_axes, op_axes).flatten()
+
+
+def apply_operation_permutation(op: qml.operation.Operator, state, is_state_batched: bool = False):
+    r"""Apply an operation that permutes the computational basis states to a qutrit mixed state.
+
+    Instead of contracting the state with the matrix of the operation on both sides, the rows and
+    columns of the density matrix are gathered according to ``op.compute_permutation()``.
+
+    Args:
+        op (Operator): Operator to apply to the quantum state. It must define ``compute_permutation``
+        state (array[complex]): Input quantum state
+        is_state_batched (bool): Boolean representing whether the state is batched or not
+
+    Returns:
+        array[complex]: output_state
+    """
+    num_wires = get_num_wires(state, is_state_batched)
+    perm = _get_basis_permutation(type(op), tuple(op.wires), num_wires)
+
+    shape = math.shape(state)
+    state = reshape_state_as_matrix(state, num_wires)
+    ndim = len(math.shape(state))
+    state = math.take(state, perm, axis=ndim - 2)
+    state = math.take(state, perm, axis=ndim - 1)
+    return math.reshape(state, shape)
+
+
 @singledispatch
 def apply_operation(
     op: qml.operation.Operator, state, is_state_batched: bool = False, debugger=None
@@ -189,4 +245,19 @@ def apply_identity(op: qml.Identity, state, is_state_batched: bool = False, debu
     return state
 
 
-# TODO add special case speedups
+@apply_operation.register
+def apply_tshift(op: qml.TShift, state, is_state_batched: bool = False, debugger=None, **_):
+    """Apply :class:`~.TShift` to the state by permuting its computational basis states."""
+    return apply_operation_permutation(op, state, is_state_batched=is_state_batched)
+
+
+@apply_operation.register
+def apply_tadd(op: qml.TAdd, state, is_state_batched: bool = False, debugger=None, **_):
+    """Apply :class:`~.TAdd` to the state by permuting its computational basis states."""
+    return apply_operation_permutation(op, state, is_state_batched=is_state_batched)
+
+
+@apply_operation.register
+def apply_tswap(op: qml.TSWAP, state, is_state_batched: bool = False, debugger=None, **_):
+    """Apply :class:`~.TSWAP` to the state by permuting its computational basis states."""
+    return apply_operation_permutation(op, state, is_state_batched=is_state_batched)
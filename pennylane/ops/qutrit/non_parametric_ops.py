@@ -26,6 +26,24 @@ from .parametric_ops import validate_subspace
 OMEGA = np.exp(2 * np.pi * 1j / 3)
 ZETA = OMEGA ** (1 / 3)  # ZETA will be used as a phase for later non-parametric operations
 
+# Static representations of the constant qutrit gates, built once at import time and shared
+# between calls, like the cached matrices of the qubit operations. The matrices of the permutation gates are
+# obtained by reordering the rows of the identity, so that ``mat @ state == state[perm]``.
+_TSHIFT_PERM = np.array([2, 0, 1])
+_TSHIFT_MAT = np.eye(3, dtype=np.complex128)[_TSHIFT_PERM]
+_TSHIFT_EIGVALS = np.array([OMEGA, OMEGA**2, 1], dtype=np.complex128)
+
+_TCLOCK_EIGVALS = np.array([1, OMEGA, OMEGA**2], dtype=np.complex128)
+_TCLOCK_MAT = np.diag(_TCLOCK_EIGVALS)
+
+_TADD_PERM = np.array([0, 1, 2, 5, 3, 4, 7, 8, 6])
+_TADD_MAT = np.eye(9, dtype=np.complex128)[_TADD_PERM]
+_TADD_EIGVALS = np.array([OMEGA, OMEGA**2, 1, OMEGA, OMEGA**2, 1, 1, 1, 1], dtype=np.complex128)
+
+_TSWAP_PERM = np.array([0, 3, 6, 1, 4, 7, 2, 5, 8])
+_TSWAP_MAT = np.eye(9, dtype=np.complex128)[_TSWAP_PERM]
+_TSWAP_EIGVALS = np.array([1, -1, 1, -1, 1, -1, 1, 1, 1], dtype=np.complex128)
+
 
 class TShift(Operation):
     r"""TShift(wires)
@@ -70,11 +88,11 @@ class TShift(Operation):
         **Example**
 
         >>> print(qml.TShift.compute_matrix())
-        [[0 0 1]
-         [1 0 0]
-         [0 1 0]]
+        [[0.+0.j 0.+0.j 1.+0.j]
+         [1.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 1.+0.j 0.+0.j]]
         """
-        return np.array([[0, 0, 1], [1, 0, 0], [0, 1, 0]])
+        return _TSHIFT_MAT
 
     @staticmethod
     def compute_eigvals():
@@ -99,7 +117,29 @@ class TShift(Operation):
         >>> print(qml.TShift.compute_eigvals())
         [ -0.5+0.8660254j -0.5-0.8660254j 1. +0.j         ]
         """
-        return np.array([OMEGA, OMEGA**2, 1])
+        return _TSHIFT_EIGVALS
+
+    @staticmethod
+    def compute_permutation():
+        r"""Representation of the operator as a permutation of the computational basis states
+        (static method).
+
+        The operator maps the computational basis state at index ``perm[i]`` to index ``i``,
+        so that applying it to a state vector ``state`` is equivalent to ``state[perm]``.
+        Simulators may use this representation to apply the operator as a gather instead
+        of a dense matrix multiplication.
+
+        .. seealso:: :meth:`~.TShift.compute_matrix`
+
+        Returns:
+            ndarray: permutation of the computational basis indices
+
+        **Example**
+
+        >>> print(qml.TShift.compute_permutation())
+        [2 0 1]
+        """
+        return _TSHIFT_PERM
 
     # TODO: Add compute_decomposition once parametric ops are added.
 
@@ -156,7 +196,7 @@ class TClock(Operation):
          [ 0. +0.j        -0.5+0.8660254j  0. +0.j       ]
          [ 0. +0.j         0. +0.j        -0.5-0.8660254j]]
         """
-        return np.diag([1, OMEGA, OMEGA**2])
+        return _TCLOCK_MAT
 
     @staticmethod
     def compute_eigvals():
@@ -180,7 +220,7 @@ class TClock(Operation):
         >>> print(qml.TClock.compute_eigvals())
         [ 1. +0.j        -0.5+0.8660254j -0.5-0.8660254j]
         """
-        return np.array([1, OMEGA, OMEGA**2])
+        return _TCLOCK_EIGVALS
 
     # TODO: Add compute_decomposition() once parametric ops are added.
 
@@ -242,29 +282,17 @@ class TAdd(Operation):
         **Example**
 
         >>> print(qml.TAdd.compute_matrix())
-        [[1 0 0 0 0 0 0 0 0]
-         [0 1 0 0 0 0 0 0 0]
-         [0 0 1 0 0 0 0 0 0]
-         [0 0 0 0 0 1 0 0 0]
-         [0 0 0 1 0 0 0 0 0]
-         [0 0 0 0 1 0 0 0 0]
-         [0 0 0 0 0 0 0 1 0]
-         [0 0 0 0 0 0 0 0 1]
-         [0 0 0 0 0 0 1 0 0]]
+        [[1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 0, 0, 0, 0, 0, 0, 1],
-                [0, 0, 0, 0, 0, 0, 1, 0, 0],
-            ]
-        )
+        return _TADD_MAT
 
     @staticmethod
     def compute_eigvals():
@@ -288,7 +316,29 @@ class TAdd(Operation):
         >>> print(qml.TAdd.compute_eigvals())
         [-0.5+0.8660254j -0.5-0.8660254j  1. +0.j        -0.5+0.8660254j -0.5-0.8660254j  1. +0.j         1. +0.j         1. +0.j         1. +0.j       ]
         """
-        return np.array([OMEGA, OMEGA**2, 1, OMEGA, OMEGA**2, 1, 1, 1, 1])
+        return _TADD_EIGVALS
+
+    @staticmethod
+    def compute_permutation():
+        r"""Representation of the operator as a permutation of the computational basis states
+        (static method).
+
+        The operator maps the computational basis state at index ``perm[i]`` to index ``i``,
+        so that applying it to a state vector ``state`` is equivalent to ``state[perm]``.
+        Simulators may use this representation to apply the operator as a gather instead
+        of a dense matrix multiplication.
+
+        .. seealso:: :meth:`~.TAdd.compute_matrix`
+
+        Returns:
+            ndarray: permutation of the computational basis indices
+
+        **Example**
+
+        >>> print(qml.TAdd.compute_permutation())
+        [0 1 2 5 3 4 7 8 6]
+        """
+        return _TADD_PERM
 
     # TODO: Add compute_decomposition() once parametric ops are added.
 
@@ -350,29 +400,17 @@ class TSWAP(Operation):
         **Example**
 
         >>> print(qml.TSWAP.compute_matrix())
-        [[1 0 0 0 0 0 0 0 0]
-         [0 0 0 1 0 0 0 0 0]
-         [0 0 0 0 0 0 1 0 0]
-         [0 1 0 0 0 0 0 0 0]
-         [0 0 0 0 1 0 0 0 0]
-         [0 0 0 0 0 0 0 1 0]
-         [0 0 1 0 0 0 0 0 0]
-         [0 0 0 0 0 1 0 0 0]
-         [0 0 0 0 0 0 0 0 1]]
+        [[1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j 0.+0.j 0.+0.j 0.+0.j]
+         [0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 0.+0.j 1.+0.j]]
         """
-        return np.array(
-            [
-                [1, 0, 0, 0, 0, 0, 0, 0, 0],
-                [0, 0, 0, 1, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 1, 0, 0],
-                [0, 1, 0, 0, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 1, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 1, 0],
-                [0, 0, 1, 0, 0, 0, 0, 0, 0],
-                [0, 0, 0, 0, 0, 1, 0, 0, 0],
-                [0, 0, 0, 0, 0, 0, 0, 0, 1],
-            ]
-        )
+        return _TSWAP_MAT
 
     @staticmethod
     def compute_eigvals():
@@ -394,9 +432,31 @@ class TSWAP(Operation):
         **Example**
 
         >>> print(qml.TSWAP.compute_eigvals())
-        [ 1. -1.  1. -1.  1. -1.  1.  1.  1.]
+        [ 1.+0.j -1.+0.j  1.+0.j -1.+0.j  1.+0.j -1.+0.j  1.+0.j  1.+0.j  1.+0.j]
+        """
+        return _TSWAP_EIGVALS
+
+    @staticmethod
+    def compute_permutation():
+        r"""Representation of the operator as a permutation of the computational basis states
+        (static method).
+
+        The operator maps the computational basis state at index ``perm[i]`` to index ``i``,
+        so that applying it to a state vector ``state`` is equivalent to ``state[perm]``.
+        Simulators may use this representation to apply the operator as a gather instead
+        of a dense matrix multiplication.
+
+        .. seealso:: :meth:`~.TSWAP.compute_matrix`
+
+        Returns:
+            ndarray: permutation of the computational basis indices
+
+        **Example**
+
+        >>> print(qml.TSWAP.compute_permutation())
+        [0 3 6 1 4 7 2 5 8]
         """
-        return np.array([1.0, -1.0, 1.0, -1.0, 1.0, -1.0, 1.0, 1.0, 1.0])
+        return _TSWAP_PERM
 
     # TODO: Add compute_decomposition()
 
@@ -22,6 +22,10 @@ from scipy.stats import unitary_group
 import pennylane as qml
 from pennylane import math
 from pennylane.devices.qutrit_mixed import apply_operation, measure
+from pennylane.devices.qutrit_mixed.apply_operation import (
+    _get_basis_permutation,
+    apply_operation_einsum,
+)
 from pennylane.operation import Channel
 
 ml_frameworks_list = [
@@ -74,7 +78,50 @@ def test_custom_operator_with_matrix(one_qutrit_state):
     assert qml.math.allclose(new_state, mat @ one_qutrit_state @ np.conj(mat).T)
 
 
-# TODO add tests for special cases as they are added
+@pytest.mark.parametrize("ml_framework", ml_frameworks_list)
+@pytest.mark.parametrize(
+    "op",
+    [
+        qml.TShift(wires=1),
+        qml.TAdd(wires=[0, 2]),
+        qml.TAdd(wires=[2, 1]),
+        qml.TSWAP(wires=[2, 0]),
+    ],
+)
+class TestPermutationOperations:
+    """Tests that operations permuting the computational basis are applied correctly."""
+
+    def test_matches_einsum(self, op, ml_framework, three_qutrit_state):
+        """Test that applying a permutation matches contracting with the operation matrix."""
+        state = qml.math.asarray(three_qutrit_state, like=ml_framework)
+        res = apply_operation(op, state)
+        expected = apply_operation_einsum(op, state)
+
+        assert qml.math.get_interface(res) == ml_framework
+        assert qml.math.allclose(res, expected)
+
+    def test_broadcasted_state(self, op, ml_framework, three_qutrit_batched_state):
+        """Test that applying a permutation to a batched state matches contracting with the
+        operation matrix."""
+        state = qml.math.asarray(three_qutrit_batched_state, like=ml_framework)
+        res = apply_operation(op, state, is_state_batched=True)
+        expected = apply_operation_einsum(op, state, is_state_batched=True)
+
+        assert qml.math.get_interface(res) == ml_framework
+        assert qml.math.allclose(res, expected)
+
+
+def test_permutation_is_cached(three_qutrit_state):
+    """Test that the basis permutation of a permutation gate is reused between applications."""
+    _get_basis_permutation.cache_clear()
+
+    apply_operation(qml.TAdd(wires=[0, 2]), three_qutrit_state)
+    apply_operation(qml.TAdd(wires=[0, 2]), three_qutrit_state)
+    assert _get_basis_permutation.cache_info().misses == 1
+    assert _get_basis_permutation.cache_info().hits == 1
+
+    apply_operation(qml.TAdd(wires=[2, 0]), three_qutrit_state)
+    assert _get_basis_permutation.cache_info().misses == 2
 
 
 @pytest.mark.parametrize("ml_framework", ml_frameworks_list)
@@ -171,6 +218,7 @@ class TestOperation:  # pylint: disable=too-few-public-methods
         qml.TClock(wires=1),
         qml.TShift(wires=2),
         qml.TAdd(wires=[1, 2]),
+        qml.TSWAP(wires=[0, 1]),
         qml.TRX(np.pi / 3, wires=0, subspace=(0, 2)),
         qml.TRY(2 * np.pi / 3, wires=1, subspace=(1, 2)),
         qml.TRZ(np.pi / 6, wires=2, subspace=(0, 1)),
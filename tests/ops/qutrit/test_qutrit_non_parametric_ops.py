@@ -62,6 +62,42 @@ class TestOperations:
         assert np.allclose(res_static, mat, atol=tol, rtol=0)
         assert np.allclose(res_dynamic, mat, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("op_cls", [qml.TShift, qml.TClock, qml.TAdd, qml.TSWAP])
+    def test_static_representations_are_cached(self, op_cls):
+        """Test that the static matrix and eigenvalues of constant operations are only built once"""
+        assert op_cls.compute_matrix() is op_cls.compute_matrix()
+        assert op_cls.compute_eigvals() is op_cls.compute_eigvals()
+
+    @pytest.mark.torch
+    @pytest.mark.filterwarnings("error")
+    @pytest.mark.parametrize("op", [qml.TShift(0), qml.TClock(0)])
+    def test_static_matrix_with_torch(self, op):
+        """Test that the cached matrices can be combined with torch tensors without warnings"""
+        import torch
+
+        param = torch.tensor(0.3, requires_grad=True)
+        res = qml.math.dot(qml.TRX(param, wires=0).matrix(), op.matrix())
+        expected = qml.TRX.compute_matrix(0.3) @ op.compute_matrix()
+        assert qml.math.allclose(res.detach().numpy(), expected)
+
+    @pytest.mark.parametrize("op_cls", [qml.TShift, qml.TClock, qml.TAdd, qml.TSWAP])
+    def test_static_representations_dtype(self, op_cls):
+        """Test that the matrices and eigenvalues of constant operations share a single
+        complex dtype"""
+        assert op_cls.compute_matrix().dtype == np.complex128
+        assert op_cls.compute_eigvals().dtype == np.complex128
+
+    @pytest.mark.parametrize("op_cls", [qml.TShift, qml.TAdd, qml.TSWAP])
+    def test_permutation(self, op_cls):
+        """Test that the permutation representation of permutation gates matches their matrix"""
+        perm = op_cls.compute_permutation()
+        dim = 3**op_cls.num_wires
+        assert np.allclose(np.eye(dim)[perm], op_cls.compute_matrix())
+
+        rng = np.random.default_rng(seed=42)
+        state = rng.random(dim) + 1j * rng.random(dim)
+        assert np.allclose(state[perm], op_cls.compute_matrix() @ state)
+
 
 class TestEigenval:
     def test_tshift_eigenval(self):